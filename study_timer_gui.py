@@ -5,7 +5,6 @@ import os
 import sys
 import json
 import pygame
-import csv
 from datetime import datetime
 
 # --- PyQt6 Imports ---
@@ -16,13 +15,15 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer, QObject, pyqtSignal, QSettings
 from PyQt6.QtGui import QIcon, QAction
 
-# --- Resource path helper ---
+# --- Resource path helper (base resolved once at import) ---
+BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
 def resource_path(relative_path):
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(BASE_PATH, relative_path)
+
+ICON_PATH = resource_path('icon.ico')
+CONFIG_PATH = resource_path('config.json')
+LOG_PATH = resource_path('study_log.csv')
 
 # --- Default configuration ---
 DEFAULT_CONFIG = {
@@ -41,38 +42,54 @@ DEFAULT_CONFIG = {
     "total_study_time": 0
 }
 
+# --- Config store (in-memory cache, written back only when dirty) ---
+class ConfigStore:
+    def __init__(self, data, dirty=False):
+        self.data = data
+        self._dirty = dirty
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value):
+        if key in self.data and self.data[key] == value:
+            return
+        self.data[key] = value
+        self._dirty = True
+
+    def save_if_dirty(self):
+        if not self._dirty:
+            return
+        save_config(self.data)
+        self._dirty = False
+
 # --- Config load/create ---
 def load_or_create_config():
-    config_path = resource_path('config.json')
-    if not os.path.exists(config_path):
-        try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(DEFAULT_CONFIG, f, indent=4, ensure_ascii=False)
-            return DEFAULT_CONFIG
-        except Exception as e:
-            print(f"Failed to create default config: {e}")
-            return DEFAULT_CONFIG
+    if not os.path.exists(CONFIG_PATH):
+        # Written on the first save_if_dirty() at the end of startup
+        return ConfigStore(dict(DEFAULT_CONFIG), dirty=True)
 
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
+        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
             user_config = json.load(f)
             updated = False
             for key, value in DEFAULT_CONFIG.items():
                 if key not in user_config:
                     user_config[key] = value
                     updated = True
-            if updated:
-                save_config(user_config)
-            return user_config
+            return ConfigStore(user_config, dirty=updated)
     except (json.JSONDecodeError, TypeError):
-        return DEFAULT_CONFIG
+        # Rewrite the unreadable file with defaults at the end of startup
+        return ConfigStore(dict(DEFAULT_CONFIG), dirty=True)
 
 # --- Config save ---
 def save_config(config_data):
-    config_path = resource_path('config.json')
+    tmp_path = CONFIG_PATH + '.tmp'
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
+        # Write next to the target and rename so a crash never leaves a truncated config
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(config_data, f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, CONFIG_PATH)
     except Exception as e:
         print(f"Error: Failed to save config: {e}")
 
@@ -80,19 +97,23 @@ def save_config(config_data):
 # Study Session Logger
 # ==============================================================================
 class StudyLogger:
-    def __init__(self, filename="study_log.csv"):
-        self.log_path = resource_path(filename)
+    def __init__(self, log_path=LOG_PATH):
+        self.log_path = log_path
         self.header = [
             'start_time', 'end_time', 'net_duration_minutes', 'date', 'day_of_week'
         ]
         self._initialize_file()
+        try:
+            self._fh = open(self.log_path, 'a', newline='', encoding='utf-8', buffering=8192)
+        except IOError as e:
+            print(f"Error: Could not open log file: {e}")
+            self._fh = None
 
     def _initialize_file(self):
         if not os.path.exists(self.log_path):
             try:
                 with open(self.log_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(self.header)
+                    f.write(','.join(self.header) + '\r\n')
             except IOError as e:
                 print(f"Error: Could not create log file: {e}")
 
@@ -100,25 +121,33 @@ class StudyLogger:
         if not all([start_time, end_time, net_duration_seconds > 0]):
             return
 
-        date_str = start_time.strftime('%Y-%m-%d')
+        start_str = start_time.strftime('%Y-%m-%d %H:%M:%S')
+        end_str = end_time.strftime('%Y-%m-%d %H:%M:%S')
+        date_str = start_str[:10]
         day_of_week = start_time.strftime('%A')
         net_duration_minutes = round(net_duration_seconds / 60, 2)
 
-        row = [
-            start_time.strftime('%Y-%m-%d %H:%M:%S'),
-            end_time.strftime('%Y-%m-%d %H:%M:%S'),
-            net_duration_minutes,
-            date_str,
-            day_of_week
-        ]
-
+        if self._fh is None:
+            return
         try:
-            with open(self.log_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(row)
+            # Fixed schema with no commas or quotes, so no csv dialect handling is needed.
+            # \r\n matches the line terminator csv.writer used for existing logs.
+            self._fh.write(f"{start_str},{end_str},{net_duration_minutes},{date_str},{day_of_week}\r\n")
+            # One write per session; flush so the row survives a crash and shows up in the open log
+            self._fh.flush()
         except IOError as e:
             print(f"Error: Failed to write log: {e}")
 
+    def close(self):
+        if self._fh is None:
+            return
+        try:
+            self._fh.flush()
+            self._fh.close()
+        except IOError as e:
+            print(f"Error: Failed to flush log: {e}")
+        self._fh = None
+
 # ==============================================================================
 # Core Logic Layer (DO NOT CHANGE: original logic)
 # ==============================================================================
@@ -132,25 +161,40 @@ class StudyTimerLogic(QObject):
         self.config = config
         self.logger = StudyLogger()
 
+        # Timing settings are fixed for the lifetime of the app
+        self._study_min = config["study_time_min"]
+        self._study_max = config["study_time_max"]
+        self._short_break = config["short_break_duration"]
+        self._long_break = config["long_break_duration"]
+        self._long_threshold = config["long_break_threshold"]
+
         self.is_paused = False
         self.time_remaining_on_pause = 0
         self.timer = QTimer(self)
         self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.on_timer_timeout)
 
-        pygame.mixer.init()
+        # Missing cues are fatal, so check the files up front; the mixer
+        # and decoding are deferred to first playback (see _ensure_audio)
         self.sound_paths = self._validate_and_get_sound_paths()
+        self._mixer_ready = False
+        self._sounds = None
 
         self.total_study_time = self.config.get("total_study_time", 0)
         self.current_cycle_study_time = 0
-        self.current_session_start_time = None
-        self.current_session_duration = 0
+        # Wall clock is only used for the log; durations come from time.monotonic()
+        self._session_started_wall = None
+        self._session_started_mono = None
+        self._session_paused_seconds = 0.0
+        self._paused_at_mono = None
 
         self.reset_cycle()
 
     def _clear_current_session(self):
-        self.current_session_start_time = None
-        self.current_session_duration = 0
+        self._session_started_wall = None
+        self._session_started_mono = None
+        self._session_paused_seconds = 0.0
+        self._paused_at_mono = None
 
     def reset_cycle(self):
         self.timer.stop()
@@ -170,12 +214,13 @@ class StudyTimerLogic(QObject):
 
     def on_timer_timeout(self):
         if self.current_state == "studying":
-            if self.current_session_start_time and self.current_session_duration > 0:
-                end_time = datetime.now()
+            if self._session_started_mono is not None:
+                end_wall = datetime.now()
+                net_seconds = round(time.monotonic() - self._session_started_mono - self._session_paused_seconds)
                 self.logger.log_session(
-                    start_time=self.current_session_start_time,
-                    end_time=end_time,
-                    net_duration_seconds=self.current_session_duration
+                    start_time=self._session_started_wall,
+                    end_time=end_wall,
+                    net_duration_seconds=net_seconds
                 )
             self._clear_current_session()
 
@@ -185,7 +230,7 @@ class StudyTimerLogic(QObject):
             self._run_short_break_cycle()
 
         elif self.current_state == "short_breaking":
-            if self.current_cycle_study_time >= self.config["long_break_threshold"]:
+            if self.current_cycle_study_time >= self._long_threshold:
                 self._run_long_break_cycle()
             else:
                 self._run_study_cycle()
@@ -199,10 +244,11 @@ class StudyTimerLogic(QObject):
     def _run_study_cycle(self):
         self.cycle_count += 1
         self.current_state = "studying"
-        study_duration = random.randint(self.config["study_time_min"], self.config["study_time_max"])
+        study_duration = random.randint(self._study_min, self._study_max)
 
-        self.current_session_start_time = datetime.now()
-        self.current_session_duration = study_duration
+        self._session_started_wall = datetime.now()
+        self._session_started_mono = time.monotonic()
+        self._session_paused_seconds = 0.0
 
         self.state_changed.emit(f"📚 Studying...\n(Round {self.cycle_count})", self.current_state)
         self._play_sound("start_study")
@@ -215,23 +261,49 @@ class StudyTimerLogic(QObject):
 
     def _validate_and_get_sound_paths(self):
         folder_path = resource_path(self.config["music_folder"])
-        if not os.path.isdir(folder_path):
+        # One directory read covers the usual plain filenames; anything else
+        # (different case, subpaths, absolute paths) falls back to isfile
+        try:
+            with os.scandir(folder_path) as it:
+                files = {entry.name for entry in it if entry.is_file()}
+        except OSError:
             raise FileNotFoundError(f"Resource folder not found: {folder_path}")
-        paths = {}
-        for key, filename in self.config["sound_files"].items():
+        sound_files = self.config["sound_files"]
+        for filename in sound_files.values():
             path = os.path.join(folder_path, filename)
-            if not os.path.isfile(path):
+            if filename not in files and not os.path.isfile(path):
                 raise FileNotFoundError(f"Audio file not found: {path}")
-            paths[key] = path
-        return paths
+        return {key: os.path.join(folder_path, filename) for key, filename in sound_files.items()}
+
+    def _ensure_audio(self):
+        if self._sounds is not None:
+            return
+        self._sounds = {}
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"Audio Error: {e}")
+            self.notification_requested.emit("Audio Error", str(e))
+            return
+        self._mixer_ready = True
+        # Decode each file once; playback then reuses the in-memory buffers.
+        # A file that fails to load only silences its own cue.
+        for key, path in self.sound_paths.items():
+            try:
+                self._sounds[key] = pygame.mixer.Sound(path)
+            except (pygame.error, OSError) as e:
+                print(f"Audio Error ({key}): {e}")
+                self.notification_requested.emit("Audio Error", f"Could not load '{key}' sound: {e}")
 
     def _play_sound(self, sound_key):
-        sound_path = self.sound_paths.get(sound_key)
-        if not sound_path:
+        self._ensure_audio()
+        snd = self._sounds.get(sound_key)
+        if not snd:
             return
         try:
-            pygame.mixer.music.load(sound_path)
-            pygame.mixer.music.play()
+            # Keep the one-cue-at-a-time behaviour of mixer.music
+            pygame.mixer.stop()
+            snd.play()
         except pygame.error as e:
             print(f"Audio Error: {e}")
 
@@ -242,14 +314,14 @@ class StudyTimerLogic(QObject):
             self.is_paused = False
             if self.current_state == "long_break_finished":
                 self.reset_cycle()
-            if self.current_cycle_study_time >= self.config["long_break_threshold"]:
+            if self.current_cycle_study_time >= self._long_threshold:
                 self._run_long_break_cycle()
             else:
                 self._run_study_cycle()
 
     def _run_short_break_cycle(self):
         self.current_state = "short_breaking"
-        break_duration = self.config["short_break_duration"]
+        break_duration = self._short_break
         self.state_changed.emit("☕ Short Break...", self.current_state)
         self.time_updated.emit(self.total_study_time)
         self._play_sound("start_short_break")
@@ -258,7 +330,7 @@ class StudyTimerLogic(QObject):
 
     def _run_long_break_cycle(self):
         self.current_state = "long_breaking"
-        break_duration = self.config["long_break_duration"]
+        break_duration = self._long_break
         self.state_changed.emit("🧘 Long Break...", self.current_state)
         self.time_updated.emit(self.total_study_time)
         self._play_sound("start_long_break")
@@ -269,6 +341,7 @@ class StudyTimerLogic(QObject):
     def pause(self):
         if self.timer.isActive():
             self.time_remaining_on_pause = self.timer.remainingTime()
+            self._paused_at_mono = time.monotonic()
             self.timer.stop()
             self.is_paused = True
             self.state_changed.emit("⏸️ Paused", self.current_state)
@@ -276,6 +349,9 @@ class StudyTimerLogic(QObject):
     def _resume(self):
         if self.is_paused:
             self.timer.start(self.time_remaining_on_pause)
+            if self._session_started_mono is not None and self._paused_at_mono is not None:
+                self._session_paused_seconds += time.monotonic() - self._paused_at_mono
+            self._paused_at_mono = None
             self.is_paused = False
             self._play_sound("start_study")
             original_state_text = {
@@ -287,15 +363,22 @@ class StudyTimerLogic(QObject):
 
     def stop(self):
         self.timer.stop()
-        pygame.mixer.quit()
+        self.logger.close()
+        if self._mixer_ready:
+            self._sounds = None
+            pygame.mixer.quit()
+            self._mixer_ready = False
 
 # ==============================================================================
 # GUI Layer (English-only UI)
 # ==============================================================================
 class StudyTimerGUI(QWidget):
-    def __init__(self, config):
+    def __init__(self, config_store, icon=None):
         super().__init__()
-        self.config = config
+        self.config_store = config_store
+        self.tray_icon = icon if icon is not None else QIcon(ICON_PATH)
+        self.config = config_store.data
+        self._long_threshold = self.config.get("long_break_threshold", 90 * 60)
 
         try:
             self.logic = StudyTimerLogic(self.config)
@@ -312,11 +395,14 @@ class StudyTimerGUI(QWidget):
         self.dragPos = None
         self.settings = QSettings("MyStudyTimer", "App")
         self.is_always_on_top = self.settings.value("ui/alwaysOnTop", True, type=bool)
+        self._opacity = self.settings.value("ui/opacity", 0.8, type=float)
+        self._last_opacity = None
 
         self.create_tray_icon()
 
+        # Single-shot, re-armed to the next second boundary while the window is visible
         self.countdown_timer = QTimer(self)
-        self.countdown_timer.setInterval(1000)
+        self.countdown_timer.setSingleShot(True)
         self.countdown_timer.timeout.connect(self.update_countdown_display)
 
         self.setWindowFlags(
@@ -369,7 +455,7 @@ class StudyTimerGUI(QWidget):
         self.tray.showMessage(title, message, self.tray_icon, 5000)
 
     def open_log_folder(self):
-        log_dir = resource_path(".")
+        log_dir = BASE_PATH
         try:
             if sys.platform == 'win32':
                 os.startfile(log_dir)
@@ -392,8 +478,9 @@ class StudyTimerGUI(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             self.logic.reset_all()
 
-    def populate_context_menu(self, menu: QMenu):
-        menu.clear()
+    def create_context_menu(self):
+        # Built once and shared by the tray icon and the window; only labels change per show
+        menu = QMenu(self)
         menu.setStyleSheet("""
             QMenu { background-color: #3B4252; border: 1px solid #4C566A; }
             QMenu::item { padding: 8px 20px; color: #ECEFF4; }
@@ -402,59 +489,28 @@ class StudyTimerGUI(QWidget):
             QMenu::separator { height: 1px; background: #4C566A; margin: 4px 0; }
         """)
 
-        if self.logic.timer.isActive() or self.logic.is_paused:
-            remaining_ms = self.logic.time_remaining_on_pause if self.logic.is_paused else self.logic.timer.remainingTime()
-            mins, secs = divmod(remaining_ms // 1000, 60)
-            status_text = f"⏳ {self.logic.current_state.replace('_', ' ')}: {int(mins)}m {int(secs)}s"
-            info_action = QAction(status_text, self)
-            info_action.setDisabled(True)
-            menu.addAction(info_action)
-
-        if self.logic.current_state != 'stopped':
-            long_break_threshold = self.config.get("long_break_threshold", 90 * 60)
-            current_study_time = self.logic.total_study_time
-
-            if current_study_time < long_break_threshold:
-                remaining_seconds = long_break_threshold - current_study_time
-                if self.logic.current_state == "studying" and self.logic.timer.isActive():
-                    timer_remaining_secs = self.logic.timer.remainingTime() // 1000
-                    remaining_seconds -= timer_remaining_secs
-
-                mins, _secs = divmod(remaining_seconds, 60)
-                long_break_status_text = f"🎯 Long Break in ~{int(mins)}m"
-            else:
-                long_break_status_text = "🎉 Long Break Available"
-
-            long_break_action = QAction(long_break_status_text, self)
-            long_break_action.setDisabled(True)
-            menu.addAction(long_break_action)
-
-        menu.addSeparator()
-
-        is_running = self.logic.timer.isActive()
-        is_paused = self.logic.is_paused
+        self.info_action = QAction("", self)
+        self.info_action.setDisabled(True)
+        self.long_break_action = QAction("", self)
+        self.long_break_action.setDisabled(True)
 
-        start_action = QAction("▶️ Start / Resume", self)
-        start_action.triggered.connect(self.logic.start_or_resume)
-        if is_running and not is_paused:
-            start_action.setDisabled(True)
+        self.start_action = QAction("▶️ Start / Resume", self)
+        self.start_action.triggered.connect(self.logic.start_or_resume)
 
-        pause_action = QAction("⏸️ Pause", self)
-        pause_action.triggered.connect(self.logic.pause)
-        if not is_running or is_paused:
-            pause_action.setDisabled(True)
+        self.pause_action = QAction("⏸️ Pause", self)
+        self.pause_action.triggered.connect(self.logic.pause)
 
-        always_on_top_text = f"{'✅' if self.is_always_on_top else '🔲'} Always on Top"
-        always_on_top_action = QAction(always_on_top_text, self)
-        always_on_top_action.triggered.connect(self.toggle_always_on_top)
+        self.always_on_top_action = QAction("", self)
+        self.always_on_top_action.triggered.connect(self.toggle_always_on_top)
 
-        opacity_menu = QMenu("💧 Opacity", self)
+        opacity_menu = QMenu("💧 Opacity", menu)
         for val in [1.0, 0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1]:
             op_action = QAction(f"{int(val * 100)}%", self)
-            op_action.triggered.connect(lambda _, v=val: self.set_opacity(v))
+            op_action.setData(val)
+            op_action.triggered.connect(self._on_opacity)
             opacity_menu.addAction(op_action)
 
-        reset_menu = QMenu("🔄 Reset", self)
+        reset_menu = QMenu("🔄 Reset", menu)
         reset_cycle_action = QAction("Reset Current Cycle", self)
         reset_cycle_action.triggered.connect(self.logic.reset_cycle)
         clear_all_action = QAction("🗑️ Clear All Statistics", self)
@@ -468,18 +524,63 @@ class StudyTimerGUI(QWidget):
         quit_action = QAction("❌ Quit", self)
         quit_action.triggered.connect(self.close)
 
-        menu.addAction(start_action)
-        menu.addAction(pause_action)
+        menu.addAction(self.info_action)
+        menu.addAction(self.long_break_action)
         menu.addSeparator()
-        menu.addAction(always_on_top_action)
+        menu.addAction(self.start_action)
+        menu.addAction(self.pause_action)
+        menu.addSeparator()
+        menu.addAction(self.always_on_top_action)
         menu.addMenu(opacity_menu)
         menu.addMenu(reset_menu)
         menu.addAction(open_log_action)
         menu.addSeparator()
         menu.addAction(quit_action)
 
+        menu.aboutToShow.connect(self.update_tray_menu)
+        return menu
+
+    def update_tray_menu(self):
+        # Query the Qt timer once per refresh
+        tmr = self.logic.timer
+        active = tmr.isActive()
+        remaining_ms = tmr.remainingTime() if active else 0
+        paused = self.logic.is_paused
+        state = self.logic.current_state
+
+        show_info = active or paused
+        self.info_action.setVisible(show_info)
+        if show_info:
+            info_ms = self.logic.time_remaining_on_pause if paused else remaining_ms
+            mins, secs = divmod(info_ms // 1000, 60)
+            self.info_action.setText(f"⏳ {state.replace('_', ' ')}: {int(mins)}m {int(secs)}s")
+
+        show_long_break = state != 'stopped'
+        self.long_break_action.setVisible(show_long_break)
+        if show_long_break:
+            long_break_threshold = self._long_threshold
+            current_study_time = self.logic.total_study_time
+
+            if current_study_time < long_break_threshold:
+                remaining_seconds = long_break_threshold - current_study_time
+                if state == "studying" and active:
+                    remaining_seconds -= remaining_ms // 1000
+
+                mins, _secs = divmod(remaining_seconds, 60)
+                self.long_break_action.setText(f"🎯 Long Break in ~{int(mins)}m")
+            else:
+                self.long_break_action.setText("🎉 Long Break Available")
+
+        self.start_action.setEnabled(not (active and not paused))
+        self.pause_action.setEnabled(active and not paused)
+
+        self.always_on_top_action.setText(f"{'✅' if self.is_always_on_top else '🔲'} Always on Top")
+
     def update_stylesheet(self):
-        opacity = self.settings.value("ui/opacity", 0.8, type=float)
+        opacity = self._opacity
+        if opacity == self._last_opacity:
+            return
+        self._last_opacity = opacity
         self.background_widget.setStyleSheet(f"""
             #background {{ background-color: rgba(46, 52, 64, {opacity}); border-radius: 10px; border: 1px solid #88C0D0; }}
             QLabel {{ background-color: transparent; color: #D8DEE9; font-family: 'Segoe UI', Arial, sans-serif; font-size: 15px; }}
@@ -489,36 +590,40 @@ class StudyTimerGUI(QWidget):
 
     def update_status(self, status_text, state_name):
         if state_name == "long_breaking":
-            self.countdown_timer.start()
             self.update_countdown_display()
         else:
             self.countdown_timer.stop()
             self.status_label.setText(status_text)
-        self.update_stylesheet()
 
     def update_countdown_display(self):
         if self.logic.timer.isActive():
             remaining_ms = self.logic.timer.remainingTime()
             mins, secs = divmod(remaining_ms // 1000, 60)
             self.status_label.setText(f"🧘 Long Break\n{int(mins):02}:{int(secs):02}")
+            if self.isVisible() and not self.isMinimized():
+                # The label floors to whole seconds, so it next changes in (remaining_ms % 1000) ms
+                self.countdown_timer.start(remaining_ms % 1000 + 1)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._init_failed and self.logic.current_state == "long_breaking":
+            self.update_countdown_display()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if not self._init_failed:
+            self.countdown_timer.stop()
 
     def create_tray_icon(self):
-        self.tray_icon = QIcon(resource_path('icon.ico'))
         self.tray = QSystemTrayIcon(self.tray_icon, self)
         # MODIFIED TOOLTIP
         self.tray.setToolTip("EZLockIn")
-        self.tray_menu = QMenu(self)
-        self.tray_menu.aboutToShow.connect(self.update_tray_menu)
+        self.tray_menu = self.create_context_menu()
         self.tray.setContextMenu(self.tray_menu)
         self.tray.show()
 
-    def update_tray_menu(self):
-        self.populate_context_menu(self.tray_menu)
-
     def contextMenuEvent(self, event):
-        context_menu = QMenu(self)
-        self.populate_context_menu(context_menu)
-        context_menu.exec(event.globalPos())
+        self.tray_menu.exec(event.globalPos())
 
     def toggle_always_on_top(self):
         self.is_always_on_top = not self.is_always_on_top
@@ -542,8 +647,8 @@ class StudyTimerGUI(QWidget):
         self.logic._clear_current_session()
         self.save_settings()
         if not self._init_failed:
-            self.config['total_study_time'] = self.logic.total_study_time
-            save_config(self.config)
+            self.config_store.set('total_study_time', self.logic.total_study_time)
+            self.config_store.save_if_dirty()
             self.logic.stop()
             self.tray.hide()
         event.accept()
@@ -552,7 +657,11 @@ class StudyTimerGUI(QWidget):
     def update_total_time(self, total_seconds):
         self.total_time_label.setText(f"Total focus: {total_seconds // 3600}h {(total_seconds // 60) % 60}m")
 
+    def _on_opacity(self):
+        self.set_opacity(self.sender().data())
+
     def set_opacity(self, value):
+        self._opacity = value
         self.settings.setValue("ui/opacity", value)
         self.update_stylesheet()
 
@@ -560,8 +669,8 @@ class StudyTimerGUI(QWidget):
         if self._init_failed:
             return
         self.settings.setValue("ui/geometry", self.saveGeometry())
-        self.settings.setValue("ui/opacity", self.settings.value("ui/opacity", 0.8))
         self.settings.setValue("ui/alwaysOnTop", self.is_always_on_top)
+        self.settings.sync()
 
     def load_settings(self):
         geometry = self.settings.value("ui/geometry")
@@ -578,15 +687,20 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
 
-    if not os.path.exists(resource_path('icon.ico')):
+    if not os.path.exists(ICON_PATH):
         QMessageBox.critical(None, "Resource Error", "Critical file 'icon.ico' not found!")
         sys.exit(1)
 
-    config = load_or_create_config()
-    window = StudyTimerGUI(config)
+    # Decode the icon once and hand it to the GUI for the tray
+    icon = QIcon(ICON_PATH)
+
+    config_store = load_or_create_config()
+    window = StudyTimerGUI(config_store, icon=icon)
 
     if window._init_failed:
         sys.exit(1)
 
+    config_store.save_if_dirty()
+
     window.show()
     sys.exit(app.exec())
\ No newline at end of file